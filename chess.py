@@ -1,6 +1,7 @@
 from copy import deepcopy
 
 from figures import Figure
+from solutions import get_writer
 
 
 class FigureAttacksAnotherError(RuntimeError):
@@ -219,35 +220,24 @@ class ChessDrawer:
             # Выводим строку в консоль.
             print(' '.join(symbols))
 
-    def write_coordinates(self, file_name: str = 'output.txt') -> None:
+    def write_coordinates(self, file_name: str = 'output.txt', output_format: str = 'text') -> None:
         """
         Данный метод записывает координаты всех фигур в указанный файл.
         :param file_name: Название файла, по умолчанию output.txt
+        :param output_format: Формат записи: text, binary или indexed, по умолчанию text.
         :return:
         """
 
-        # Получаем координаты всех фигур.
-        figures_coordinates = self.chess.get_all_figures()
-
-        # Открываем файл для записи.
-        file = open(file_name, 'w')
-        # В первую строку записываем суммарное количество фигур.
-        print(len(figures_coordinates), file=file)
-        # Перебираем все пары координат.
-        for coordinates_pair in figures_coordinates:
-            # Распаковываем координаты в x и y соотвественно.
-            x, y = coordinates_pair
-            # Записываем строку с координатами.
-            print(f'({x}, {y})', file=file)
-
-        # Закрываем файл.
-        file.close()
+        # Записываем координаты всех фигур как одно решение в выбранном формате.
+        with get_writer(file_name, self.chess.board_size, output_format) as writer:
+            writer.write(self.chess.get_all_figures())
 
     @staticmethod
     def write_no_solutions(file_name='output.txt') -> None:
         """
-        Данный метод no solutions в файл.
+        Данный метод записывает no solutions в файл.
         :param file_name: Название файла, по умолчанию output.txt
         :return:
         """
-        print('no solutions', file=open(file_name, 'w'))
+        with open(file_name, 'w') as file:
+            print('no solutions', file=file)
@@ -0,0 +1,350 @@
+import mmap
+import struct
+
+
+class UnknownSolutionsFormatError(RuntimeError):
+    """
+    Данное исключение необходимо выбрасывать, когда формат файла с решениями не удалось распознать.
+    """
+    pass
+
+
+class SolutionWriter:
+    """
+    Данный класс является интерфейсом для всех форматов записи решений.
+    Решения записываются потоково: каждое решение передаётся в метод write сразу после нахождения.
+    """
+
+    # Размер буфера записи в байтах.
+    BUFFER_SIZE = 1 << 16
+
+    def __init__(self, file_name: str, board_size: int) -> None:
+        self.file_name = file_name
+        self.board_size = board_size
+        self.count = 0
+        self.file = None
+
+    def open(self) -> None:
+        """
+        Данный метод открывает файл для записи.
+        :return:
+        """
+        self.file = open(self.file_name, 'wb', buffering=self.BUFFER_SIZE)
+
+    def write(self, solution: list) -> None:
+        """
+        Данный метод записывает одно решение в файл.
+        :param solution: Список координат, состоящий из кортежей вида (x, y).
+        :return:
+        """
+        raise NotImplementedError()
+
+    def write_all(self, solutions) -> None:
+        """
+        Данный метод записывает все решения из итерируемого объекта.
+        :param solutions: Итерируемый объект, состоящий из списков координат.
+        :return:
+        """
+        for solution in solutions:
+            self.write(solution)
+
+    def close(self) -> None:
+        """
+        Данный метод сбрасывает буфер и закрывает файл.
+        :return:
+        """
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class TextSolutionWriter(SolutionWriter):
+    """
+    Данный класс записывает решения в текстовом виде: количество фигур, затем строки вида (x, y).
+    """
+
+    def open(self) -> None:
+        self.file = open(self.file_name, 'w', buffering=self.BUFFER_SIZE)
+
+    def write(self, solution: list) -> None:
+        # Формируем все строки решения и записываем их одним вызовом.
+        lines = [str(len(solution))]
+        lines.extend(f'({x}, {y})' for x, y in solution)
+        lines.append('')
+        self.file.write('\n'.join(lines))
+
+        self.count += 1
+
+
+class BinarySolutionWriter(SolutionWriter):
+    """
+    Данный класс записывает решения в упакованном бинарном виде: каждое решение хранится
+    как битовое множество из N² бит, где бит с номером x * N + y означает фигуру на клетке (x, y).
+    """
+
+    # Сигнатура файла.
+    MAGIC = b'CHB1'
+    # Заголовок: сигнатура и размер доски.
+    HEADER = struct.Struct('<4sI')
+
+    def __init__(self, file_name: str, board_size: int) -> None:
+        super().__init__(file_name, board_size)
+        # Размер одного решения в байтах.
+        self.record_size = (board_size * board_size + 7) // 8
+
+    def open(self) -> None:
+        super().open()
+        self.file.write(self.HEADER.pack(self.MAGIC, self.board_size))
+
+    def write(self, solution: list) -> None:
+        self.file.write(pack_solution(solution, self.board_size, self.record_size))
+
+        self.count += 1
+
+
+class IndexedSolutionWriter(SolutionWriter):
+    """
+    Данный класс записывает решения в файл, пригодный для отображения в память (mmap).
+    Каждое решение хранится как список пар координат, а в конце файла располагается индекс
+    смещений, позволяющий получить решение по его номеру без чтения всего файла.
+    """
+
+    # Сигнатура файла.
+    MAGIC = b'CHI1'
+    # Заголовок: сигнатура, размер доски, количество решений и смещение индекса.
+    HEADER = struct.Struct('<4sIQQ')
+    # Заголовок решения: количество фигур.
+    RECORD_HEADER = struct.Struct('<I')
+    # Одна пара координат.
+    COORDINATES = struct.Struct('<HH')
+    # Один элемент индекса: смещение решения от начала файла.
+    INDEX_ENTRY = struct.Struct('<Q')
+
+    def __init__(self, file_name: str, board_size: int) -> None:
+        super().__init__(file_name, board_size)
+        self.offsets = []
+        self.position = 0
+
+    def open(self) -> None:
+        super().open()
+        # Резервируем место под заголовок, он будет дописан при закрытии файла.
+        self.file.write(self.HEADER.pack(self.MAGIC, self.board_size, 0, 0))
+        self.position = self.HEADER.size
+
+    def write(self, solution: list) -> None:
+        # Запоминаем смещение решения для индекса.
+        self.offsets.append(self.position)
+
+        record = bytearray(self.RECORD_HEADER.pack(len(solution)))
+        for x, y in solution:
+            record += self.COORDINATES.pack(x, y)
+        self.file.write(record)
+
+        self.position += len(record)
+        self.count += 1
+
+    def close(self) -> None:
+        if self.file is None:
+            return
+
+        # Записываем индекс смещений в конец файла.
+        index_offset = self.position
+        self.file.write(b''.join(self.INDEX_ENTRY.pack(offset) for offset in self.offsets))
+
+        # Дописываем заголовок с итоговым количеством решений и смещением индекса.
+        self.file.seek(0)
+        self.file.write(self.HEADER.pack(self.MAGIC, self.board_size, self.count, index_offset))
+
+        super().close()
+
+
+# Доступные форматы записи решений.
+WRITERS = {
+    'text': TextSolutionWriter,
+    'binary': BinarySolutionWriter,
+    'indexed': IndexedSolutionWriter
+}
+
+
+def get_writer(file_name: str, board_size: int, output_format: str = 'text') -> SolutionWriter:
+    """
+    Данная функция создаёт экземпляр класса записи решений для указанного формата.
+    :param file_name: Название файла.
+    :param board_size: Размер доски.
+    :param output_format: Название формата: text, binary или indexed.
+    :return: Экземпляр класса записи решений.
+    """
+    if output_format not in WRITERS:
+        raise UnknownSolutionsFormatError(output_format)
+
+    return WRITERS[output_format](file_name, board_size)
+
+
+def pack_solution(solution: list, board_size: int, record_size: int) -> bytes:
+    """
+    Данная функция упаковывает решение в битовое множество.
+    :param solution: Список координат, состоящий из кортежей вида (x, y).
+    :param board_size: Размер доски.
+    :param record_size: Размер битового множества в байтах.
+    :return: Битовое множество в виде байтов.
+    """
+    bits = 0
+    for x, y in solution:
+        bits |= 1 << (x * board_size + y)
+
+    return bits.to_bytes(record_size, 'little')
+
+
+def unpack_solution(record: bytes, board_size: int) -> list:
+    """
+    Данная функция распаковывает битовое множество в список координат.
+    :param record: Битовое множество в виде байтов.
+    :param board_size: Размер доски.
+    :return: Список координат, состоящий из кортежей вида (x, y).
+    """
+    bits = int.from_bytes(record, 'little')
+
+    coordinates = []
+    while bits:
+        # Выделяем младший установленный бит и вычисляем его номер.
+        lowest = bits & -bits
+        coordinates.append(divmod(lowest.bit_length() - 1, board_size))
+        bits ^= lowest
+
+    return coordinates
+
+
+class SolutionReader:
+    """
+    Данный класс читает решения, записанные любым из форматов, и позволяет получать их по номеру.
+    Формат определяется по сигнатуре файла, бинарные форматы отображаются в память.
+    """
+
+    def __init__(self, file_name: str) -> None:
+        self.file_name = file_name
+        self.file = None
+        self.buffer = None
+        self.format = None
+        self.board_size = None
+        self.count = 0
+        # Решения текстового формата, который не поддерживает произвольный доступ.
+        self.solutions = None
+        # Параметры бинарных форматов.
+        self.record_size = 0
+        self.index_offset = 0
+
+    def open(self) -> None:
+        """
+        Данный метод открывает файл и определяет его формат.
+        :return:
+        """
+        self.file = open(self.file_name, 'rb')
+        magic = self.file.read(4)
+
+        if magic == BinarySolutionWriter.MAGIC:
+            self.format = 'binary'
+            self.buffer = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            _, self.board_size = BinarySolutionWriter.HEADER.unpack_from(self.buffer)
+            self.record_size = (self.board_size * self.board_size + 7) // 8
+            data_size = len(self.buffer) - BinarySolutionWriter.HEADER.size
+            self.count = data_size // self.record_size if self.record_size else 0
+        elif magic == IndexedSolutionWriter.MAGIC:
+            self.format = 'indexed'
+            self.buffer = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            _, self.board_size, self.count, self.index_offset = IndexedSolutionWriter.HEADER.unpack_from(self.buffer)
+        else:
+            self.format = 'text'
+            self.file.seek(0)
+            self.solutions = self.__parse_text(self.file.read().decode())
+            self.count = len(self.solutions)
+
+    def close(self) -> None:
+        """
+        Данный метод закрывает файл.
+        :return:
+        """
+        if self.buffer is not None:
+            self.buffer.close()
+            self.buffer = None
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self):
+        for number in range(self.count):
+            yield self[number]
+
+    def __getitem__(self, number: int) -> list:
+        """
+        Данный метод возвращает решение по его номеру.
+        :param number: Номер решения, начиная с 0.
+        :return: Список координат, состоящий из кортежей вида (x, y).
+        """
+        if number < 0:
+            number += self.count
+        if not 0 <= number < self.count:
+            raise IndexError(number)
+
+        if self.format == 'text':
+            return self.solutions[number]
+
+        if self.format == 'binary':
+            start = BinarySolutionWriter.HEADER.size + number * self.record_size
+            return unpack_solution(self.buffer[start:start + self.record_size], self.board_size)
+
+        # Получаем смещение решения из индекса.
+        offset, = IndexedSolutionWriter.INDEX_ENTRY.unpack_from(
+            self.buffer, self.index_offset + number * IndexedSolutionWriter.INDEX_ENTRY.size
+        )
+        figures_count, = IndexedSolutionWriter.RECORD_HEADER.unpack_from(self.buffer, offset)
+        offset += IndexedSolutionWriter.RECORD_HEADER.size
+
+        return [
+            IndexedSolutionWriter.COORDINATES.unpack_from(self.buffer, offset + i * IndexedSolutionWriter.COORDINATES.size)
+            for i in range(figures_count)
+        ]
+
+    @staticmethod
+    def __parse_text(text: str) -> list:
+        """
+        Данный метод разбирает текстовый формат: количество фигур, затем строки вида (x, y).
+        :param text: Содержимое файла.
+        :return: Список решений.
+        """
+        lines = [line.strip() for line in text.splitlines() if line.strip()]
+
+        solutions = []
+        position = 0
+        while position < len(lines):
+            # Файл без решений содержит строку no solutions.
+            if lines[position] == 'no solutions':
+                position += 1
+                continue
+
+            figures_count = int(lines[position])
+            solution = []
+            for line in lines[position + 1:position + 1 + figures_count]:
+                x, y = map(int, line.strip('()').split(','))
+                solution.append((x, y))
+
+            solutions.append(solution)
+            position += 1 + figures_count
+
+        return solutions